@@ -11,12 +11,137 @@ import os
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import Polygon
-from matplotlib.collections import PatchCollection
-from matplotlib.cm import get_cmap
+from matplotlib.collections import PolyCollection
 
-from sympy.solvers import solve
-from sympy import Symbol
+#+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#
+
+# colors of Matplotlib's "tab10" qualitative colormap, used to color each arm
+# of the tessellation
+_TAB10 = np.array( [
+  [  31, 119, 180 ],
+  [ 255, 127,  14 ],
+  [  44, 160,  44 ],
+  [ 214,  39,  40 ],
+  [ 148, 103, 189 ],
+  [ 140,  86,  75 ],
+  [ 227, 119, 194 ],
+  [ 127, 127, 127 ],
+  [ 188, 189,  34 ],
+  [  23, 190, 207 ] ] ) / 255
+
+#+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#
+
+def _rotation_matrices( theta ):
+
+  """Initialize rotation matrices for an array of angles
+
+  Parameters
+  ----------
+  theta : numpy.ndarray
+    Array of shape ( k, ) specifying rotation angles (in radians)
+
+  Returns
+  -------
+  numpy.ndarray
+    Array of shape ( k, 2, 2 ) of rotation matrices, one for each angle
+
+  """
+
+  cos_theta = np.cos( theta )
+  sin_theta = np.sin( theta )
+
+  rot_mats = np.empty( ( len( theta ), 2, 2 ), dtype = np.float32 )
+  rot_mats[ :, 0, 0 ] = cos_theta
+  rot_mats[ :, 0, 1 ] = sin_theta
+  rot_mats[ :, 1, 0 ] = -sin_theta
+  rot_mats[ :, 1, 1 ] = cos_theta
+
+  return rot_mats
+
+#+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#
+
+def _rotate_arms( arm, theta, out ):
+
+  """Rotate all points in all triangles of an arm by each of several angles
+
+  Parameters
+  ----------
+  arm : numpy.ndarray
+    Array of shape ( N, 3, 2 ) specifying ( x, y ) coordinates of all 3 points
+    of all triangles in the arm
+  theta : numpy.ndarray
+    Array of shape ( k, ) specifying rotation angles (in radians)
+  out : numpy.ndarray
+    Array of shape ( k, N, 3, 2 ) in which the rotated arms are stored
+
+  Returns
+  -------
+  numpy.ndarray
+    The ``out`` array
+
+  """
+
+  # rotate all arms in a single pass, writing directly into ``out``
+  return np.einsum(
+    'rab,tpb->rtpa', _rotation_matrices( theta ), arm, out = out )
+
+#+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#
+
+def _build_arm( A, s, a, b, C, N ):
+
+  """Generate a sequence of tesselated triangles, for a single arm
+
+  Parameters
+  ----------
+  A : float
+    Angle of lower-right corner of triangle (in radians)
+  s : float
+    Scaling factor between consecutive triangles
+  a : float
+    Length of the side opposite angle ``A``
+  b : float
+    Length of the side opposite angle ``B``
+  C : float
+    Angle of lower-left corner of triangle (in radians)
+  N : int
+    Number of triangle tiles to generate
+
+  Returns
+  -------
+  numpy.ndarray
+    Array of shape ( N, 3, 2 ) specifying ( x, y ) coordinates of all 3 points
+    of all triangles in the tessellation sequence
+
+  """
+
+  # define points C, B, and A of the first triangle in the tessellation
+  # sequence as a single array of shape ( 3, 2 ), in single precision since
+  # the coordinates are only used for visualization
+  triangle = np.array( [
+    [ 0, 0 ],
+    [ a * np.cos( C ), a * np.sin( C ) ],
+    [ b, 0 ] ], dtype = np.float32 )
+
+  # each triangle is obtained from the previous one by rotating it about its
+  # point C by angle ``A``, scaling it by ``s``, and moving its point C to
+  # point B of the previous triangle. The linear part of this affine map is
+  # ``M = s * R( A )``, so the i-th triangle is ``M^i`` applied to the first
+  # triangle, translated by the sum of ``M^k ( B - C )`` for all ``k < i``.
+  # Since ``M^i = s^i * R( i * A )``, all powers are computed in closed form
+  i = np.arange( N )
+  M_pow = _rotation_matrices( i * A )
+  M_pow *= ( s ** i )[ :, None, None ]
+
+  # apply all powers of ``M`` to the first triangle, whose point C is already
+  # at the origin
+  triangles = np.einsum( 'iab,pb->ipa', M_pow, triangle )
+
+  # translate each triangle such that its point C is in the same location as
+  # point B of the previous triangle. Point B of each triangle computed above
+  # is already ``M^k ( B - C )``, so it is reused as the translation step
+  triangles[ 1: ] += np.cumsum( triangles[ :-1, 1 ], axis = 0 )[ :, None, : ]
+
+  return triangles
 
 #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#
 
@@ -49,6 +174,11 @@ class MultiTriangleTiling( ):
     self.A = ( 2 * np.pi / self.m - np.pi + self.C ) / ( self.n - 1 )
     self.B = np.pi - ( self.A + self.C )
 
+    # initialize rotation matrix to rotate by angle ``A``
+    self.rot_A = np.array( [
+      [ np.cos( self.A ), np.sin( self.A ) ],
+      [ -np.sin( self.A ), np.cos( self.A ) ] ], dtype = np.float32 )
+
     # compute side lengths based on the Law of Sines
     self.a = np.sin( self.A ) / np.sin( self.C )
     self.b = np.sin( self.B ) / np.sin( self.C )
@@ -64,15 +194,24 @@ class MultiTriangleTiling( ):
     """Compute the scaling factor `s`
     """
 
-    # initialize scaling factor as unknown variable, assuming it's real and
-    # greater than zero
-    _s = Symbol( 's', real = True, positive = True )
+    # for ``n`` equal to 1, the polynomial ``( a + b ) * s - 1`` is linear
+    if self.n == 1:
+      self.s = float( 1 / ( self.a + self.b ) )
+      return
+
+    # initialize coefficients of the polynomial ``a * s^n + b * s - 1``, from
+    # highest to lowest degree
+    coeffs = np.zeros( self.n + 1 )
+    coeffs[ 0 ] = self.a
+    coeffs[ self.n - 1 ] = self.b
+    coeffs[ self.n ] = -1
 
-    # solve for scaling factor (first argument is expression set equal to zero)
-    s = solve( self.a * _s ** self.n + self.b * _s - 1, _s )
+    # solve for scaling factor, keeping only the real roots
+    roots = np.roots( coeffs )
+    roots = roots[ np.abs( roots.imag ) < 1e-9 ].real
 
-    # save result as float
-    self.s = float( s[ 0 ] )
+    # save the positive root as float
+    self.s = float( roots[ roots > 0 ].min( ) )
 
   #---------------------------------------------------------------------------#
 
@@ -95,29 +234,19 @@ class MultiTriangleTiling( ):
 
     """
 
-    # initialize rotation matrix to rotate by angle ``A``
-    rot_mat = np.array( [
-      [ np.cos( self.A ), np.sin( self.A ) ],
-      [ -np.sin( self.A ), np.cos( self.A ) ] ] )
-
-    # initialize next triangle and translate it such that point C is at the
-    # origin
-    _next_triangle = triangle.copy( )
-    rot_shift = _next_triangle[ 0 ]
-    _next_triangle -= rot_shift
+    # translate a copy of the triangle such that point C is at the origin
+    _next_triangle = triangle - triangle[ 0 ]
 
-    # rotate each point in the next triangle by angle ``A`` using the rotation
-    # matrix
-    for i in range( 3 ):
-      _next_triangle[ i ] = np.dot( rot_mat, _next_triangle[ i ] )
+    # rotate all points in the next triangle by angle ``A`` using the cached
+    # rotation matrix, as a single ( 3, 2 ) x ( 2, 2 ) matrix product
+    _next_triangle = _next_triangle @ self.rot_A.T
 
     # scale the next triangle by the scaling factor
     _next_triangle *= self.s
 
     # translate the next triangle such that point C is at point B of the
     # original triangle
-    _next_triangle += rot_shift
-    _next_triangle += ( triangle[ 1 ] - triangle[ 0 ] )
+    _next_triangle += triangle[ 1 ]
 
     return _next_triangle
 
@@ -143,30 +272,11 @@ class MultiTriangleTiling( ):
     # store N as an instance variable
     self.N = N
 
-    # initialize array to store locations of points for all triangles in the
-    # tessellation sequence
-    self.triangles = np.zeros( ( self.N, 3, 2 ) )
+    # compute the array of points for all triangles in the arm
+    self.triangles = _build_arm(
+      A = self.A, s = self.s, a = self.a, b = self.b, C = self.C, N = self.N )
 
-    # define points of the first triangle in the tessellation sequence
-    point_c = np.array( [ 0, 0 ] )
-    point_b = self.a * np.array( [ np.cos( self.C ), np.sin( self.C ) ] )
-    point_a = np.array( [ self.b, 0 ] )
-
-    # stack the points into a single array of shape (3, 2 )
-    triangle = np.vstack( [ point_c, point_b, point_a ] )
-
-    # loop over the number of triangles in the sequence
-    for i in range( self.N ):
-
-      # store the points of the i-th triangle in the array
-      self.triangles[ i ] = triangle
-
-      # compute the next triangle in the tessellation sequence
-      triangle = self.next_triangle( triangle = triangle )
-
-      # shift the next triangle in the tessellation sequence such that its
-      # point C is in the same location as point B of the previous triangle
-      triangle += ( self.triangles[ i - 1, 1 ] - self.triangles[ 0, 0 ] )
+    return self.triangles
 
   #---------------------------------------------------------------------------#
 
@@ -183,7 +293,8 @@ class MultiTriangleTiling( ):
     -------
     numpy.ndarray
       Array of shape ( m, n, 3, 2 ) specifying ( x, y ) coordinates of all 3
-      points of all triangles in the tessellation sequence, for all arms
+      points of all triangles in the tessellation sequence, for all arms.
+      The same array is overwritten by later calls with the same ``N``
 
     """
 
@@ -191,45 +302,113 @@ class MultiTriangleTiling( ):
     # tessellation
     self.get_triangles( N = N )
 
-    # initialize array of points for all triangles in ALL arms of the
-    # tessellation, and store the triangles for the first arm in it
-    self.all_triangles = np.zeros( ( self.m, self.N, 3, 2 ) )
-    self.all_triangles[ 0 ] = self.triangles
-
     # compute the angle by which each arm is rotated
     self.theta_m = 2 * np.pi / self.m
 
-    # loop over arms
-    for i in range( 1, self.m ):
+    # initialize array of points for all triangles in ALL arms of the
+    # tessellation, reusing the array from a previous call if it has the same
+    # shape (e.g. when sweeping angle ``A`` with ``update``)
+    shape = ( self.m, self.N, 3, 2 )
+    if ( getattr( self, 'all_triangles', None ) is None
+      or self.all_triangles.shape != shape ):
+      self.all_triangles = np.empty( shape, dtype = np.float32 )
+
+    # rotate all points in all triangles of the first arm by the rotation
+    # angle of every arm, about point A of the first triangle in the arm
+    rot_shift = self.triangles[ 0, 2 ]
+    _rotate_arms(
+      arm = self.triangles - rot_shift,
+      theta = self.theta_m * np.arange( self.m ),
+      out = self.all_triangles )
+
+    # translate each arm such that point A of its first triangle is at point B
+    # in the ``n``-th triangle of the previous arm. Since every arm is a
+    # rotated copy of the first one, these translations are a cumulative sum
+    # of the rotated offset between the two points, which is exactly point B
+    # in the ``n``-th triangle of each arm computed above
+    self.all_triangles[ 1: ] += np.cumsum(
+      self.all_triangles[ :-1, self.n - 1, 1 ], axis = 0 )[ :, None, None, : ]
+    self.all_triangles += rot_shift
+
+    return self.all_triangles
+
+  #---------------------------------------------------------------------------#
+
+  def get_bounds( self, square = False ):
+
+    """Compute the spatial bounds and aspect ratio of the visualization, from
+    the most recently generated triangles for all arms
+
+    Parameters
+    ----------
+    square : bool
+      If ``True``, aspect ratio of the visualization is 1
 
-      # compute rotation angle for the given arm
-      theta = self.theta_m * i
+    Returns
+    -------
+    tuple
+      Bounds ( x_min, x_max, y_min, y_max ) of the visualization
+    float
+      Aspect ratio of the visualization
 
-      # initialize rotation matrix for the arm rotation angle
-      rot_mat = np.array( [
-        [ np.cos( theta ), np.sin( theta ) ],
-        [ -np.sin( theta ), np.cos( theta ) ] ] )
+    """
 
-      # translate a copy of the first arm such that point A of the first
-      # triangle in the arm is at the origin
-      rot_shift = self.triangles[ 0, 2 ]
-      new_arm = self.triangles.copy( )
-      new_arm -= rot_shift
+    # compute spatial bounds of the tessellation
+    points = self.all_triangles.reshape( -1, 2 )
+    x_min, y_min = points.min( axis = 0 ) * 1.02
+    x_max, y_max = points.max( axis = 0 ) * 1.02
 
-      # rotate all points in all triangles in the arm, by the
-      # rotation angle
-      for tri in range( N ):
-        for point in range( 3 ):
-          new_arm[ tri, point ] = np.dot( rot_mat, new_arm[ tri, point ] )
+    # compute aspect ratio of visualization
+    if square:
+      ratio = 1
+      y_max = y_min + ( x_max - x_min )
+    else:
+      ratio = ( y_max - y_min ) / ( x_max - x_min )
 
-      # Translate the new arm such that point A of the first triangle in the
-      # new arm is at point B in the ``n``-th triangle in the first arm
-      new_arm += self.all_triangles[ i - 1, self.n - 1, 1 ]
+    return ( x_min, x_max, y_min, y_max ), ratio
 
-      # store rotated arm in the i-th element of the ``all_triangles`` array`
-      self.all_triangles[ i ] = new_arm
+  #---------------------------------------------------------------------------#
 
-    return self.all_triangles
+  def add_collection( self, ax ):
+
+    """Add a single matplotlib PolyCollection of the triangles of all arms to
+    an axis, from the most recently generated triangles for all arms
+
+    The vertices of the returned collection can be replaced in place with
+    ``PolyCollection.set_verts``, so that a single figure can be reused to
+    draw many tilings with the same number of arms and triangles.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+      Axis to which the collection is added
+
+    Returns
+    -------
+    matplotlib.collections.PolyCollection
+      Collection of all ``m * N`` triangles, colored by arm
+
+    """
+
+    # get array of colors used to color each arm of the tessellation, cycling
+    # through the colors if there are more arms than colors, and repeat it for
+    # each triangle in the arm
+    colors = np.resize( _TAB10, ( self.m, 3 ) )
+    facecolors = np.repeat( colors, self.N, axis = 0 )
+
+    # create a matplotlib PolyCollection directly from the array of all
+    # triangles in all arms, with all styling set once for the collection
+    p = PolyCollection(
+      verts = self.all_triangles.reshape( -1, 3, 2 ),
+      facecolors = facecolors,
+      edgecolors = 'k',
+      linewidths = 1.0,
+      joinstyle = 'miter' )
+
+    # add the PolyCollection to the figure axis
+    ax.add_collection( p )
+
+    return p
 
   #---------------------------------------------------------------------------#
 
@@ -253,51 +432,14 @@ class MultiTriangleTiling( ):
     # compute all points for all triangles for all arms
     self.get_all_triangles( N = N )
 
-    # compute spatial bounds of the tessellation
-    x_min = np.min( self.all_triangles[ :, :, :, 0 ] ) * 1.02
-    x_max = np.max( self.all_triangles[ :, :, :, 0 ] ) * 1.02
-    y_min = np.min( self.all_triangles[ :, :, :, 1 ] ) * 1.02
-    y_max = np.max( self.all_triangles[ :, :, :, 1 ] ) * 1.02
-
-    # compute aspect ratio of visualization
-    if square:
-      ratio = 1
-      y_max = y_min + ( x_max - x_min )
-    else:
-      ratio = ( y_max - y_min ) / ( x_max - x_min )
+    # compute spatial bounds and aspect ratio of the visualization
+    ( x_min, x_max, y_min, y_max ), ratio = self.get_bounds( square = square )
 
     # initialize figure and axis of visualization
     fig, ax = plt.subplots( figsize = ( 8, 8 * ratio ) )
 
-    # get list of colors used to color each arm of the tessellation
-    colors = get_cmap( 'tab10' ).colors
-
-    # loop over arms
-    for i , color in zip( range( self.m ), colors ):
-
-      # initialize list of matplotlib Polygons
-      patches = list( )
-
-      # loop over all triangles in the arm
-      for triangle in self.all_triangles[ i ]:
-
-        # append a matplotlib Polygon of the given triangle to the the
-        # polygon list
-        polygon = Polygon(
-          xy = triangle,
-          closed = True,
-          joinstyle = 'miter' )
-        patches.append( polygon )
-
-      # create a matplotlib PatchCollection of the list of polygons
-      p = PatchCollection(
-        patches = patches,
-        color = color,
-        edgecolor = 'k',
-        linewidth = 1.0, )
-
-      # add the PatchCollection to the figure axis
-      ax.add_collection( p )
+    # add the triangles of all arms to the figure axis
+    self.add_collection( ax = ax )
 
     # set bounds of visualization, and remove axis box and tickmarks
     ax.set_xlim( x_min, x_max )
@@ -311,8 +453,8 @@ class MultiTriangleTiling( ):
     if filename is None:
       return ax
     else:
-      plt.savefig( filename, bbox_inches = 'tight' )
-      plt.close( )
+      fig.savefig( filename, bbox_inches = 'tight' )
+      plt.close( fig )
 
 #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#
 
@@ -327,23 +469,61 @@ class RegularMultiTriangleTiling( MultiTriangleTiling ):
     Angle of lower-right corner of triangle (in degrees)
   m : int
     Number of arms in the tiling
+  degrees : bool
+    If ``False``, angle ``A`` is specified in radians instead of degrees
 
   """
 
-  def __init__( self, A, m ):
+  def __init__( self, A, m, degrees = True ):
 
     # store n and m as instance variables
     self.n = 1
     self.m = int( m )
 
-    # compute all 3 triangle angles in radians
-    self.A = np.deg2rad( A )
+    # compute angle C in radians, which only depends on the number of arms
     self.C = np.pi - 2 * np.pi / self.m
+    self.cos_C = np.cos( self.C )
+    self.sin_C = np.sin( self.C )
+
+    # compute all quantities that depend on angle ``A``
+    self.update( A, degrees = degrees )
+
+  #---------------------------------------------------------------------------#
+
+  def update( self, A, degrees = True ):
+
+    """Change angle ``A`` of the triangle, keeping the number of arms fixed
+
+    This avoids constructing a new tiling when sweeping over many values of
+    angle ``A``, e.g. to generate an animation.
+
+    Parameters
+    ----------
+    A : float
+      Angle of lower-right corner of triangle (in degrees)
+    degrees : bool
+      If ``False``, angle ``A`` is specified in radians instead of degrees
+
+    """
+
+    # compute the remaining 2 triangle angles in radians
+    self.A = np.deg2rad( A ) if degrees else A
     self.B = np.pi - ( self.A + self.C )
 
-    # compute side lengths based on the Law of Sines
-    self.a = np.sin( self.A ) / np.sin( self.C )
-    self.b = np.sin( self.B ) / np.sin( self.C )
+    # compute the sine and cosine of angle ``A`` once, and reuse them for the
+    # rotation matrix and the side lengths
+    cos_A = np.cos( self.A )
+    sin_A = np.sin( self.A )
+
+    # initialize rotation matrix to rotate by angle ``A``
+    self.rot_A = np.array( [
+      [ cos_A, sin_A ],
+      [ -sin_A, cos_A ] ], dtype = np.float32 )
+
+    # compute side lengths based on the Law of Sines, using
+    # ``sin( B ) = sin( A + C )``
+    self.a = sin_A / self.sin_C
+    self.b = ( sin_A * self.cos_C + cos_A * self.sin_C ) / self.sin_C
     self.c = 1
 
     # compute scaling factor
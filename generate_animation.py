@@ -6,9 +6,18 @@
 #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#
 
 import os
+import gc
+from multiprocessing import Pool
 
 import numpy as np
+
+# frames are only ever saved to file, so use the non-interactive Agg backend,
+# with path simplification and chunked path rendering
+import matplotlib
+matplotlib.use( 'Agg' )
 import matplotlib.pyplot as plt
+plt.rcParams[ 'path.simplify' ] = True
+plt.rcParams[ 'agg.path.chunksize' ] = 10000
 
 from TriangleTiling import (
   RegularMultiTriangleTiling, )
@@ -20,15 +29,68 @@ OUTPUT_DIR = 'pentagon_animation'
 m = 5
 N = 100
 
-os.makedirs( OUTPUT_DIR, exist_ok = True )
-
 A_values = np.arange( 1, int( 360 / 5 ), 1 )
 
-for A in A_values:
+# convert all angles to radians at once, rather than once per frame
+A_radians = np.deg2rad( A_values )
+
+#+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#
+
+def _render( indices ):
+
+  """Generate and save the tiling for each value of angle ``A`` in a chunk of
+  indices into ``A_values``, reusing a single tiling, figure, and
+  collection for all of them
+  """
+
+  # initialize the tiling, figure, and collection of all triangles from the
+  # first value of angle ``A``
+  tiling = RegularMultiTriangleTiling(
+    A = A_radians[ indices[ 0 ] ], m = m, degrees = False )
+  tiling.get_all_triangles( N = N )
+
+  fig, ax = plt.subplots( )
+  p = tiling.add_collection( ax = ax )
+  ax.axis( 'off' )
+  plt.subplots_adjust( 0, 0, 1, 1 )
+
+  for i, index in enumerate( indices ):
+
+    # recompute the tiling for the given angle, and replace the vertices of
+    # the existing collection. The first angle was already computed above
+    if i > 0:
+      tiling.update( A = A_radians[ index ], degrees = False )
+      tiling.get_all_triangles( N = N )
+      p.set_verts( tiling.all_triangles.reshape( -1, 3, 2 ) )
 
-  tiling = RegularMultiTriangleTiling( A = A, m = m )
-  tiling.plot(
-    N = N,
-    filename = os.path.join( OUTPUT_DIR, f'{A:02d}.png' ) )
+    # set bounds and size of visualization
+    ( x_min, x_max, y_min, y_max ), ratio = tiling.get_bounds( )
+    fig.set_size_inches( 8, 8 * ratio )
+    ax.set_xlim( x_min, x_max )
+    ax.set_ylim( y_min, y_max )
 
-#+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#
\ No newline at end of file
+    fig.savefig(
+      os.path.join( OUTPUT_DIR, f'{A_values[ index ]:02d}.png' ),
+      bbox_inches = 'tight' )
+
+    # periodically release objects left behind by rendering, to keep the
+    # memory footprint of long sweeps small
+    if i % 10 == 9:
+      gc.collect( )
+
+  plt.close( fig )
+
+#+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#
+
+if __name__ == '__main__':
+
+  os.makedirs( OUTPUT_DIR, exist_ok = True )
+
+  # each frame is independent, so split the frames into one chunk per core
+  # and render the chunks in parallel
+  n_chunks = min( os.cpu_count( ) or 1, len( A_values ) )
+  with Pool( n_chunks ) as pool:
+    pool.map(
+      _render, np.array_split( np.arange( len( A_values ) ), n_chunks ) )
+
+#+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#